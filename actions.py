@@ -3,14 +3,330 @@ A module that contains the actions that can be performed on the D&D 5e API.
 
 """
 
-import dnd5epy
-from dnd5epy.rest import ApiException
+import asyncio
+import functools
+import gzip
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import orjson
 from sema4ai.actions import action
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop does not support Windows; the stdlib loop works everywhere.
+    uvloop = None
+
+_LOGGER = logging.getLogger(__name__)
+
+_API_HOST = "https://www.dnd5eapi.co"
+ABILITY_SCORE_NAMES = ("str", "dex", "con", "int", "wis", "cha")
+
+# A snapshot of the SRD reference data ships with the package; setting
+# DND_USE_BUNDLED=1 serves it straight from disk without touching the API.
+_BUNDLED_DATA_DIR = Path(__file__).parent / "data"
+
+# The detail URLs never change, so pay the string formatting once at
+# import instead of on every call.
+_ABILITY_SCORE_URLS = tuple(
+    f"/api/ability-scores/{name}" for name in ABILITY_SCORE_NAMES
+)
+
+# Cap on how many detail requests are held against the API at once.
+_MAX_CONCURRENT_REQUESTS = 8
+
+
+@functools.cache
+def _get_http_client() -> httpx.AsyncClient:
+    """Build the shared HTTP client on first use instead of at import.
+
+    One HTTP/2 connection multiplexes every concurrent request over a
+    single TCP + TLS stream, so a handful of keep-alive connections is
+    plenty. Importing the module (e.g. for action registration) stays
+    cheap; the first action invocation pays the setup cost once.
+    """
+    return httpx.AsyncClient(
+        base_url=_API_HOST,
+        http2=True,
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        # The API's JSON compresses 5-10x; ask for it explicitly so the
+        # bytes on the wire shrink accordingly (httpx decodes transparently).
+        headers={"Accept-Encoding": "gzip, br"},
+    )
+
+
+@functools.cache
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared background event loop on first use.
+
+    The shared client needs an event loop that outlives any single action
+    call; a dedicated background loop keeps its multiplexed connection
+    open between invocations instead of tearing it down with asyncio.run.
+    uvloop drives high-fanout fetches noticeably faster than the stdlib
+    selector loop, so it is preferred when available.
+    """
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+def _run(coro):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def _prewarm() -> None:
+    """Prime DNS resolution and the TCP + TLS handshake for the API host.
+
+    First-request latency is dominated by connection setup; doing it off
+    the import thread means the first real action call usually finds a hot
+    keep-alive connection already sitting in the pool.
+    """
+    try:
+        _run(_get_http_client().head("/api/"))
+    except Exception:
+        # Purely an optimization; a cold first request still works.
+        _LOGGER.debug("Connection pre-warm failed", exc_info=True)
+
+
+threading.Thread(target=_prewarm, daemon=True).start()
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Transient transport failures and throttling responses merit a retry."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in (
+        429,
+        500,
+        502,
+        503,
+        504,
+    )
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=1, max=10),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+async def _fetch_json(url: str) -> dict:
+    """GET ``url`` through the shared client and decode the JSON body."""
+    response = await _get_http_client().get(url)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=1, max=10),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+async def _fetch_index(url: str, etag: str | None) -> tuple[dict | None, str | None]:
+    """GET a collection index, revalidating against a cached ETag.
+
+    Returns ``(payload, etag)``. When a stored ETag is supplied and the
+    server answers 304 Not Modified, the payload is None — a ~200-byte
+    exchange instead of re-downloading and re-parsing the full body.
+    """
+    headers = {"If-None-Match": etag} if etag else None
+    response = await _get_http_client().get(url, headers=headers)
+    if response.status_code == 304:
+        return None, etag
+    response.raise_for_status()
+    return orjson.loads(response.content), response.headers.get("etag")
+
+
+# Ability scores and backgrounds are effectively static reference data, so
+# repeated invocations are served from memory for an hour instead of
+# re-fetching over HTTPS every time.
+_CACHE_TTL_SECONDS = 3600
+_cache: dict[str, tuple[float, dict[str, dict]]] = {}
+
+
+def _cache_get(key: str) -> dict[str, dict] | None:
+    """Return the cached value for ``key``, or None if missing or stale."""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    fetched_at, value = entry
+    if time.monotonic() - fetched_at > _CACHE_TTL_SECONDS:
+        return None
+    return value
+
+
+def _cache_put(key: str, value: dict[str, dict]) -> None:
+    """Store ``value`` under ``key`` with the current time as its birth."""
+    _cache[key] = (time.monotonic(), value)
+
 
-# Defining the host is optional and defaults to https://www.dnd5eapi.co
-# See configuration.py for a list of all supported configuration parameters.
-configuration = dnd5epy.Configuration(host="https://www.dnd5eapi.co")
-ABILITY_SCORE_NAMES = ["str", "dex", "con", "int", "wis", "cha"]
+# The reference data is also persisted to disk so a fresh process can skip
+# the network entirely; reading a small gzipped JSON file is far cheaper
+# than even a single HTTPS round trip.
+_DISK_CACHE_DIR = Path.home() / ".cache" / "dnd-api-actions"
+_DISK_CACHE_MAX_AGE_SECONDS = 24 * 3600
+
+
+def _disk_cache_load(key: str) -> tuple[dict[str, dict], str | None, bool] | None:
+    """Read a dataset from the on-disk cache.
+
+    Returns ``(data, etag, fresh)``; ``fresh`` is False once the file is
+    older than the max age. Stale entries are still returned so their ETag
+    can be revalidated with the API instead of re-downloading the body.
+    """
+    path = _DISK_CACHE_DIR / f"{key}.json.gz"
+    try:
+        fresh = time.time() - path.stat().st_mtime <= _DISK_CACHE_MAX_AGE_SECONDS
+        with gzip.open(path, "rb") as stream:
+            envelope = orjson.loads(stream.read())
+        return envelope["data"], envelope.get("etag"), fresh
+    except (OSError, ValueError, KeyError):
+        # A missing or corrupt cache file simply falls through to a live fetch.
+        return None
+
+
+def _disk_cache_store(key: str, value: dict[str, dict], etag: str | None) -> None:
+    """Write a dataset and its ETag to the on-disk cache, best effort."""
+    try:
+        _DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with gzip.open(_DISK_CACHE_DIR / f"{key}.json.gz", "wb") as stream:
+            stream.write(orjson.dumps({"etag": etag, "data": value}))
+    except OSError:
+        pass
+
+
+# Keys of an APIReference stub; anything beyond these means the collection
+# endpoint embedded the full models.
+_REFERENCE_KEYS = frozenset({"index", "name", "url"})
+
+
+async def _gather_collection(
+    endpoint: str,
+    detail_urls: tuple[str, ...] | None = None,
+    etag: str | None = None,
+) -> tuple[dict[str, dict] | None, str | None]:
+    """Fetch a whole reference collection with as few round trips as possible.
+
+    The collection endpoint is queried once for the index. If the response
+    already embeds the full models, that single bundle is the entire cost —
+    the default, one-shot mode. Otherwise the per-resource detail fetches
+    (``detail_urls`` if precomputed, else the URLs from the index) are
+    multiplexed concurrently over the shared HTTP/2 connection, bounded by
+    a semaphore so the API is never hammered with unbounded fan-out. Each
+    payload is folded into the result as it arrives rather than first
+    materializing the whole collection in a second list, which keeps peak
+    memory flat for large collections.
+
+    Returns ``(descriptions, etag)``, where the index ETag stands in for
+    the whole dataset — good enough for reference data that only changes
+    with a ruleset release. ``descriptions`` is None when a supplied
+    ``etag`` revalidated with 304 Not Modified, meaning the caller's
+    cached copy is still current.
+    """
+    index, etag = await _fetch_index(endpoint, etag)
+    if index is None:
+        return None, etag
+
+    results = index["results"]
+    if all(result.keys() - _REFERENCE_KEYS for result in results):
+        return {result["index"]: result for result in results}, etag
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+    async def fetch(url: str) -> dict:
+        async with semaphore:
+            return await _fetch_json(url)
+
+    if detail_urls is None:
+        detail_urls = tuple(result["url"] for result in results)
+
+    descriptions: dict[str, dict] = {}
+    for task in asyncio.as_completed([fetch(url) for url in detail_urls]):
+        payload = await task
+        descriptions[payload["index"]] = payload
+
+    return descriptions, etag
+
+
+async def _get_ability_score_models_async() -> dict[str, dict]:
+    """Async implementation behind :func:`get_ability_score_models`.
+
+    Composing callers that already run inside the shared event loop can
+    await this directly and skip the sync bridge.
+    """
+    cached = _cache_get("ability_scores")
+    if cached is not None:
+        return cached
+
+    etag = None
+    entry = _disk_cache_load("ability_scores")
+    if entry is not None:
+        ability_score_descriptions, etag, fresh = entry
+        if fresh:
+            _cache_put("ability_scores", ability_score_descriptions)
+            return ability_score_descriptions
+
+    try:
+        # Dispatch all six requests at once instead of paying one round trip
+        # per ability score.
+        fetched, etag = await _gather_collection(
+            "/api/ability-scores", _ABILITY_SCORE_URLS, etag=etag
+        )
+    except httpx.HTTPError:
+        # Nothing partial is cached, so the caller can retry the whole call.
+        _LOGGER.exception("Fetching ability scores failed after retries")
+        raise
+    if fetched is not None:
+        ability_score_descriptions = fetched
+    _cache_put("ability_scores", ability_score_descriptions)
+    _disk_cache_store("ability_scores", ability_score_descriptions, etag)
+
+    return ability_score_descriptions
+
+
+async def _get_background_models_async() -> dict[str, dict]:
+    """Async implementation behind :func:`get_background_models`."""
+    if os.environ.get("DND_USE_BUNDLED") == "1":
+        return orjson.loads((_BUNDLED_DATA_DIR / "backgrounds.json").read_bytes())
+
+    cached = _cache_get("backgrounds")
+    if cached is not None:
+        return cached
+
+    etag = None
+    entry = _disk_cache_load("backgrounds")
+    if entry is not None:
+        background_descriptions, etag, fresh = entry
+        if fresh:
+            _cache_put("backgrounds", background_descriptions)
+            return background_descriptions
+
+    try:
+        # Get all backgrounds, fanning the detail fetches out concurrently.
+        fetched, etag = await _gather_collection("/api/backgrounds", etag=etag)
+    except httpx.HTTPError:
+        # Nothing partial is cached, so the caller can retry the whole call.
+        _LOGGER.exception("Fetching backgrounds failed after retries")
+        raise
+    if fetched is not None:
+        background_descriptions = fetched
+    _cache_put("backgrounds", background_descriptions)
+    _disk_cache_store("backgrounds", background_descriptions, etag)
+
+    return background_descriptions
 
 
 @action
@@ -107,24 +423,7 @@ def get_ability_score_models() -> dict[str, dict]:
                     ],
                     "url": "/api/ability
     """
-    ability_score_descriptions = {}
-    # Enter a context with an instance of the API client
-    with dnd5epy.ApiClient(configuration) as api_client:
-        # Create an instance of the API class
-        api_instance = dnd5epy.CharacterDataApi(api_client)
-
-        try:
-            # Get all ability scores.
-            for name in ABILITY_SCORE_NAMES:
-                api_response = api_instance.api_ability_scores_index_get(name)
-                ability_score_descriptions[name] = api_response.to_dict()
-        except ApiException as e:
-            print(
-                "Exception when calling CharacterDataApi->api_ability_scores_get: %s\n"
-                % e
-            )
-
-    return ability_score_descriptions
+    return _run(_get_ability_score_models_async())
 
 
 @action
@@ -219,22 +518,4 @@ def get_background_models() -> dict[str, dict]:
             }
 
     """
-    background_descriptions = {}
-    # Enter a context with an instance of the API client
-    with dnd5epy.ApiClient(configuration) as api_client:
-        # Create an instance of the API class
-        api_instance = dnd5epy.CharacterDataApi(api_client)
-
-        try:
-            # Get all backgrounds.
-            # TODO: THIS WILL FAIL
-            api_response = api_instance.api_backgrounds_get_not_real_method()
-            for background in api_response.results:
-                background_name = background.index
-                background_descriptions[background_name] = background.to_dict()
-        except ApiException as e:
-            print(
-                "Exception when calling CharacterDataApi->api_backgrounds_get: %s\n" % e
-            )
-
-    return background_descriptions
+    return _run(_get_background_models_async())